@@ -6,7 +6,7 @@
  * project path + git branch combination.
  */
 
-import { execSync } from 'node:child_process';
+import { execFileSync } from 'node:child_process';
 import { resolve } from 'node:path';
 import { existsSync } from 'node:fs';
 import { createLogger } from './logger.js';
@@ -330,11 +330,15 @@ export class ConversationManager {
       }
 
       // Get current branch name
-      const branch = execSync('git rev-parse --abbrev-ref HEAD', {
-        cwd: projectPath,
-        encoding: 'utf-8',
-        stdio: ['ignore', 'pipe', 'ignore'], // Suppress stderr to avoid "fatal: not a git repository" warnings
-      }).trim();
+      const branch = execFileSync(
+        'git',
+        ['rev-parse', '--abbrev-ref', 'HEAD'],
+        {
+          cwd: projectPath,
+          encoding: 'utf-8',
+          stdio: ['ignore', 'pipe', 'ignore'], // Suppress stderr to avoid "fatal: not a git repository" warnings
+        }
+      ).trim();
 
       logger.debug('Detected git branch', { projectPath, branch });
 
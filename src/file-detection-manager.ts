@@ -12,6 +12,18 @@ import { PathValidationUtils } from './path-validation-utils.js';
 
 const logger = createLogger('FileDetectionManager');
 
+// Compiled wildcard patterns, keyed by normalized pattern
+const wildcardRegexCache = new Map<string, RegExp>();
+
+function getWildcardRegex(normalizedPattern: string): RegExp {
+  let regex = wildcardRegexCache.get(normalizedPattern);
+  if (!regex) {
+    regex = new RegExp(normalizedPattern.replace(/\*/g, '.*'));
+    wildcardRegexCache.set(normalizedPattern, regex);
+  }
+  return regex;
+}
+
 export interface DetectedFile {
   path: string;
   relativePath: string;
@@ -49,30 +61,35 @@ export class FileDetectionManager {
       design: [],
     };
 
-    // Search in each location
-    for (const location of searchLocations) {
-      try {
-        await access(location);
-        const files = await this.scanLocation(location);
-
-        // Match files against patterns
-        for (const file of files) {
-          const matches = this.matchFileToPatterns(file, patterns);
-
-          for (const match of matches) {
-            result[match.type].push({
-              path: file.path,
-              relativePath: file.relativePath,
-              type: match.type,
-              confidence: match.confidence,
-            });
-          }
+    // Scan all locations concurrently, then merge results in location order
+    const scannedLocations = await Promise.all(
+      searchLocations.map(async location => {
+        try {
+          await access(location);
+          return await this.scanLocation(location);
+        } catch (error) {
+          logger.debug('Search location not accessible', {
+            location,
+            error: error instanceof Error ? error.message : 'Unknown error',
+          });
+          return [];
+        }
+      })
+    );
+
+    for (const files of scannedLocations) {
+      // Match files against patterns
+      for (const file of files) {
+        const matches = this.matchFileToPatterns(file, patterns);
+
+        for (const match of matches) {
+          result[match.type].push({
+            path: file.path,
+            relativePath: file.relativePath,
+            type: match.type,
+            confidence: match.confidence,
+          });
         }
-      } catch (error) {
-        logger.debug('Search location not accessible', {
-          location,
-          error: error instanceof Error ? error.message : 'Unknown error',
-        });
       }
     }
 
@@ -200,7 +217,7 @@ export class FileDetectionManager {
 
       // Pattern matching with wildcards
       if (normalizedPattern.includes('*')) {
-        const regex = new RegExp(normalizedPattern.replace(/\*/g, '.*'));
+        const regex = getWildcardRegex(normalizedPattern);
         return regex.test(fileName) || regex.test(relativePath);
       }
 
@@ -233,11 +250,15 @@ export class FileDetectionManager {
    * Sort by confidence and remove duplicates
    */
   private sortAndDeduplicate(files: DetectedFile[]): DetectedFile[] {
-    // Remove duplicates by path
-    const unique = files.filter(
-      (file, index, array) =>
-        array.findIndex(f => f.path === file.path) === index
-    );
+    // Remove duplicates by path (first occurrence wins)
+    const seenPaths = new Set<string>();
+    const unique = files.filter(file => {
+      if (seenPaths.has(file.path)) {
+        return false;
+      }
+      seenPaths.add(file.path);
+      return true;
+    });
 
     // Sort by confidence (high first) and then by path length (shorter first)
     return unique.sort((a, b) => {
@@ -1,4 +1,4 @@
-import { execSync } from 'node:child_process';
+import { execFileSync } from 'node:child_process';
 import { existsSync } from 'node:fs';
 import { createLogger } from './logger.js';
 
@@ -24,11 +24,15 @@ export class GitManager {
         return 'default';
       }
 
-      const branch = execSync('git rev-parse --abbrev-ref HEAD', {
-        cwd: projectPath,
-        encoding: 'utf-8',
-        stdio: ['ignore', 'pipe', 'ignore'],
-      }).trim();
+      const branch = execFileSync(
+        'git',
+        ['rev-parse', '--abbrev-ref', 'HEAD'],
+        {
+          cwd: projectPath,
+          encoding: 'utf-8',
+          stdio: ['ignore', 'pipe', 'ignore'],
+        }
+      ).trim();
 
       logger.debug('Detected git branch', { projectPath, branch });
       return branch;
@@ -49,7 +53,7 @@ export class GitManager {
         return null;
       }
 
-      const hash = execSync('git rev-parse HEAD', {
+      const hash = execFileSync('git', ['rev-parse', 'HEAD'], {
         cwd: projectPath,
         encoding: 'utf-8',
         stdio: ['ignore', 'pipe', 'ignore'],
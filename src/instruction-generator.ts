@@ -96,16 +96,25 @@ export class InstructionGenerator {
     const substitutions =
       this.projectDocsManager.getVariableSubstitutions(projectPath);
 
-    let result = instructions;
-    for (const [variable, value] of Object.entries(substitutions)) {
-      // Use global replace to handle multiple occurrences
-      result = result.replace(
-        new RegExp(this.escapeRegExp(variable), 'g'),
-        value
-      );
+    // Only variables that actually occur need to go through the regex engine
+    const variables = Object.keys(substitutions).filter(variable =>
+      instructions.includes(variable)
+    );
+    if (variables.length === 0) {
+      return instructions;
     }
 
-    return result;
+    // Single pass over the instructions: one alternation of all variables,
+    // longest first so no variable shadows another that it prefixes
+    const pattern = new RegExp(
+      variables
+        .sort((a, b) => b.length - a.length)
+        .map(variable => this.escapeRegExp(variable))
+        .join('|'),
+      'g'
+    );
+
+    return instructions.replace(pattern, match => substitutions[match]);
   }
 
   /**
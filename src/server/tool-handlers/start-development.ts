@@ -557,7 +557,7 @@ ${templateOptionsText}
    */
   private getCurrentGitBranch(projectPath: string): string {
     try {
-      const { execSync } = require('node:child_process');
+      const { execFileSync } = require('node:child_process');
       const { existsSync } = require('node:fs');
 
       // Check if this is a git repository
@@ -570,11 +570,15 @@ ${templateOptionsText}
       }
 
       // Get current branch name
-      const branch = execSync('git rev-parse --abbrev-ref HEAD', {
-        cwd: projectPath,
-        encoding: 'utf-8',
-        stdio: ['ignore', 'pipe', 'ignore'], // Suppress stderr
-      }).trim();
+      const branch = execFileSync(
+        'git',
+        ['rev-parse', '--abbrev-ref', 'HEAD'],
+        {
+          cwd: projectPath,
+          encoding: 'utf-8',
+          stdio: ['ignore', 'pipe', 'ignore'], // Suppress stderr
+        }
+      ).trim();
 
       this.logger.debug('Detected git branch', { projectPath, branch });
 
@@ -211,14 +211,14 @@ export class TemplateManager {
     additionalFiles: Array<{ relativePath: string; content: Buffer }>
   ): Promise<void> {
     const currentPath = join(basePath, relativePath);
-    const items = await readdir(currentPath);
+    const entries = await readdir(currentPath, { withFileTypes: true });
 
-    for (const item of items) {
+    for (const entry of entries) {
+      const item = entry.name;
       const itemPath = join(currentPath, item);
       const itemRelativePath = relativePath ? join(relativePath, item) : item;
-      const stats = await stat(itemPath);
 
-      if (stats.isDirectory()) {
+      if (entry.isDirectory()) {
         // Recursively process subdirectories
         await this.loadAdditionalFiles(
           basePath,
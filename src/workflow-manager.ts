@@ -14,6 +14,11 @@ import { YamlStateMachine } from './state-machine-types.js';
 
 const logger = createLogger('WorkflowManager');
 
+// Resolved workflows directory, shared by all WorkflowManager instances.
+// The search strategies only depend on the install location and process
+// environment, so the directory probing runs once per process.
+let cachedWorkflowsDirectory: string | undefined;
+
 export interface WorkflowInfo {
   name: string;
   displayName: string;
@@ -149,6 +154,13 @@ export class WorkflowManager {
    * This handles both development and npm package deployment scenarios
    */
   private findWorkflowsDirectory(): string | null {
+    if (cachedWorkflowsDirectory) {
+      logger.debug('Using cached workflows directory', {
+        workflowsDir: cachedWorkflowsDirectory,
+      });
+      return cachedWorkflowsDirectory;
+    }
+
     const currentFileUrl = import.meta.url;
     const currentFilePath = new URL(currentFileUrl).pathname;
     const strategies: string[] = [];
@@ -217,10 +229,12 @@ export class WorkflowManager {
         if (fs.existsSync(cachePath)) {
           try {
             // Look for responsible-vibe-mcp in cache subdirectories
-            const cacheEntries = fs.readdirSync(cachePath);
+            const cacheEntries = fs.readdirSync(cachePath, {
+              withFileTypes: true,
+            });
             for (const entry of cacheEntries) {
-              const entryPath = path.join(cachePath, entry);
-              if (fs.statSync(entryPath).isDirectory()) {
+              const entryPath = path.join(cachePath, entry.name);
+              if (entry.isDirectory()) {
                 // Look for our package in this cache entry
                 const possiblePaths = [
                   path.join(
@@ -281,6 +295,7 @@ export class WorkflowManager {
               workflowsDir,
               yamlFiles: yamlFiles.length,
             });
+            cachedWorkflowsDirectory = workflowsDir;
             return workflowsDir;
           }
         } catch (error) {